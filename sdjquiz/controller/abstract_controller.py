@@ -1,20 +1,65 @@
-import random
-import yaml
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
 from sdjquiz.vue.abstract_vue import QuizVue
 from sdjquiz.model import Quiz
 from sdjquiz.exceptions import *
 
+_load_yaml = None
+_yaml_errors: tuple = ()
+
+# Parsed quiz data keyed on (path, mtime_ns, size) so edits invalidate entries
+_yaml_cache: dict[tuple[str, int, int], dict] = {}
+
+
+def _get_yaml_backend():
+    """
+    Resolves the YAML parsing backend on first use, so importing the
+    controller does not pay the yaml (or pyfastyaml) import cost.
+
+    Returns:
+        tuple:  the parse callable and the exception classes it may raise
+    """
+    global _load_yaml, _yaml_errors
+    if _load_yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as yaml_loader
+        except ImportError:
+            from yaml import SafeLoader as yaml_loader
+        try:
+            import pyfastyaml
+
+            def load(data):
+                return pyfastyaml.loads(data)
+
+            errors = (pyfastyaml.YAMLError, yaml.YAMLError)
+        except ImportError:
+            def load(data):
+                return yaml.load(data, Loader=yaml_loader)
+
+            errors = (yaml.YAMLError,)
+        _load_yaml, _yaml_errors = load, errors
+    return _load_yaml, _yaml_errors
+
 
 class QuizController(ABC):
 
-    vue: QuizVue
     quiz_file: Path
 
     def __init__(self):
         self.quiz = None
-        self.vue = self.get_quiz_controller_vue()
+
+    @cached_property
+    def vue(self) -> QuizVue:
+        """
+        The QuizVue instance, created on first access so the vue and its
+        imports are only paid when something has to be displayed.
+
+        Returns:
+            QuizVue:    The QuizVue subclass instance to use as vue
+        """
+        return self.get_quiz_controller_vue()
 
     @abstractmethod
     def get_quiz_controller_vue(self) -> QuizVue:
@@ -35,34 +80,37 @@ class QuizController(ABC):
         Returns:
             None
         """
+        load_yaml, yaml_errors = _get_yaml_backend()
         try:
-            with open(filepath) as quiz_file:
-                quiz_data = yaml.load(quiz_file, yaml.Loader)
-                quiz = Quiz.from_dict(quiz_data)
+            file_stat = filepath.stat()
+            cache_key = (str(filepath), file_stat.st_mtime_ns, file_stat.st_size)
+            quiz_data = _yaml_cache.get(cache_key)
+            if quiz_data is None:
+                quiz_data = load_yaml(filepath.read_bytes())
+                _yaml_cache[cache_key] = quiz_data
+            quiz = Quiz.from_dict(dict(quiz_data))
         except FileNotFoundError:
             raise QuizzError(f"File {filepath} not found.")
         except PermissionError:
             raise QuizzError(f"Could not load data from {filepath}: permissions error")
-        except yaml.YAMLError:
+        except yaml_errors:
             raise QuizzError(f"Could not load data from {filepath}: YAML error")
-        except QuizzError as error:
-            raise error
         except OSError:
             raise QuizzError("Incorrect file path.")
         else:
             self.quiz = quiz
 
     @abstractmethod
-    def get_user_answer(self, answers_count: int, correct_count: int) -> set[int]:
+    def get_user_answer(self, answers_count: int, correct_count: int) -> int:
         """
-        Ask the user answer(s) and returns a set of values.
+        Ask the user answer(s) and returns them as a bitmask.
 
         Args:
             answers_count:  the number of answers shown
             correct_count:  the number of correct answers
 
         Returns:
-            set[int]:       the set of user answers
+            int:    the user answers as a bitmask (bit i set for answer i+1)
         """
         pass
 
@@ -73,6 +121,8 @@ class QuizController(ABC):
         Returns:
             None
         """
+        import random
+
         # Welcomes the user
         self.vue.show_greetings(self.quiz.title, self.quiz.description, self.quiz.questions_count,
                                 self.quiz.max_score)
@@ -80,32 +130,36 @@ class QuizController(ABC):
         # Ask the user how many questions he wants
         questions_count = self.vue.ask_questions_count(default_count=self.quiz.questions_count)
 
-        # Get the list of questions
-        questions = self.quiz.get_questions(questions_count)
+        # Get the list of questions and their total score
+        questions, max_score = self.quiz.get_questions(questions_count)
 
         # Initialize the user score
         score = 0
-        max_score = sum(question.score for question in questions)
 
         # Ask selected questions
         for idx, question in enumerate(questions):
             self.vue.clear()
 
-            # Randomize answers order
+            # Randomize answers order without mutating the question's own list
             answers = question.answers
-            random.shuffle(answers)
+            perm = random.sample(range(len(answers)), len(answers))
 
-            # Create a set of correct answers index
-            correct = set([idx for idx, answer in enumerate(answers) if answer.correct])
+            # Build the displayed texts and map the precomputed correct bitmask through the permutation
+            correct_mask = question.correct_mask
+            texts = [answers[old_idx].text for old_idx in perm]
+            correct = 0
+            for new_idx, old_idx in enumerate(perm):
+                if correct_mask & (1 << old_idx):
+                    correct |= 1 << new_idx
+            correct_count = correct.bit_count()
 
             # Display the question
-            self.vue.show_question(idx, question.title, question.text, [answer.text for answer in answers],
-                                   len(correct))
+            self.vue.show_question(idx, question.title, question.text, texts, correct_count)
 
-            # Get answer from user (should retard a set of answer indexes)
-            user_answer = self.get_user_answer(len(answers), len(correct))
+            # Get answer from user (should return a bitmask of answer indexes)
+            user_answer = self.get_user_answer(len(answers), correct_count)
 
-            # If sets matches add question score to the total
+            # If masks matches add question score to the total
             if user_answer == correct:
                 score += question.score
 
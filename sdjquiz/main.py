@@ -1,13 +1,13 @@
 from sdjquiz.controller.basic_tui_controller import ConsoleQuizController
-import signal
-import sys
 
 
-def signal_handler(sig, frame):
-    sys.exit(0)
+def main():
+    import signal
+    import sys
 
+    def signal_handler(sig, frame):
+        sys.exit(0)
 
-def main():
     signal.signal(signal.SIGINT, signal_handler)
     controller = ConsoleQuizController()
     controller.start()
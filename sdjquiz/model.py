@@ -1,41 +1,123 @@
-import random
-import uuid
+import operator
+import os
+import sys
 from sdjquiz.exceptions import AnswerError, QuestionError, QuizzError
 
 
+# Shared pool of keyword tuples so questions with identical keyword sets share one object
+_keyword_pool: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _pooled_keywords(keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Returns the pooled instance of a sorted keywords tuple, sharing
+    identical tuples across questions.
+
+    Args:
+        keywords (tuple[str, ...]): the sorted keywords tuple
+
+    Returns:
+        tuple[str, ...]:    the shared tuple instance
+    """
+    return _keyword_pool.setdefault(keywords, keywords)
+
+
+def parse_choice_mask(text: str) -> int:
+    """
+    Parses a choice string such as "1,3,7" into a bitmask with bit i set
+    for each chosen answer i+1. Characters outside 1-9 are ignored, so the
+    result is only meaningful for up to nine answers.
+
+    Args:
+        text (str): the choice string
+
+    Returns:
+        int:    the bitmask of chosen answer indexes
+    """
+    mask = 0
+    for char in text:
+        if "1" <= char <= "9":
+            mask |= 1 << (ord(char) - ord("1"))
+    return mask
+
+
 class Answer:
     """Represents an answer of a question"""
+
+    __slots__ = ("_text", "_text_lower", "correct")
+
     def __init__(self, text: str, correct: bool = False) -> None:
-        self.text = text
+        self._text = text
+        self._text_lower = None
         self.correct = correct
 
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self._text_lower = None
+
     def __repr__(self) -> str:
         return f"Answer(text='{self.text:.30}', correct={self.correct})"
 
     def __str__(self) -> str:
-        return self.text.lower()
+        if self._text_lower is None:
+            self._text_lower = self._text.lower()
+        return self._text_lower
 
 
 class Question:
     """Represents a multiple choice question"""
-    def __init__(self, title: str, text: str, keywords: list[str], score: int, answers: list[Answer],
-                 unique_id: str or None = None) -> None:
-        self.__unique_id = unique_id if unique_id is not None else str(uuid.uuid4())
-        self.__title = title
+
+    __slots__ = ("__unique_id", "__title", "__text", "__text_lower", "__keywords", "score", "__answers",
+                 "__correct_mask")
+
+    def __init__(self, title: str, text: str, keywords: list[str], score: int,
+                 answers: list[Answer] or tuple[Answer, ...], unique_id: str or None = None) -> None:
+        self.__unique_id = unique_id
+        self.__title = sys.intern(title)
         self.__text = text
-        self.__keywords = keywords
-        self.__score = score
-        self.__answers = answers
+        self.__text_lower = None
+        self.__keywords = _pooled_keywords(tuple(sorted({sys.intern(keyword) for keyword in keywords})))
+        if score < 0:
+            raise ValueError(f"Score value {score} is incorrect. Must be >= 0")
+        self.score = score
+        self.__answers = tuple(answers)
+        self.__correct_mask = Question._compute_correct_mask(self.__answers)
+
+    @staticmethod
+    def _compute_correct_mask(answers: tuple[Answer, ...]) -> int:
+        """
+        Computes the correct-answer bitmask (bit i set when answers[i] is correct).
+
+        Args:
+            answers (list[Answer]):     the list of answers
+
+        Returns:
+            int:    the bitmask of correct answer indexes
+        """
+        mask = 0
+        for index, answer in enumerate(answers):
+            if answer.correct:
+                mask |= 1 << index
+        return mask
 
     def __repr__(self):
         return f"Question(title={repr(self.title):.20}, text={repr(self.text):.20}, keywords={repr(self.keywords)}," \
                f"score={self.score}, answers={repr(self.__answers)}, unique_id={repr(self.__unique_id)})"
 
     def __str__(self):
-        return self.text.lower()
+        if self.__text_lower is None:
+            self.__text_lower = self.__text.lower()
+        return self.__text_lower
 
     @property
     def unique_id(self):
+        if self.__unique_id is None:
+            self.__unique_id = os.urandom(16).hex()
         return self.__unique_id
 
     @property
@@ -44,7 +126,7 @@ class Question:
 
     @title.setter
     def title(self, text: str):
-        self.__title = text.lower()
+        self.__title = sys.intern(text.lower())
 
     @property
     def text(self) -> str:
@@ -53,24 +135,19 @@ class Question:
     @text.setter
     def text(self, text: str):
         self.__text = text.lower()
+        self.__text_lower = None
 
     @property
     def keywords(self):
         return self.__keywords
 
     @property
-    def score(self) -> int:
-        return self.__score
-
-    @score.setter
-    def score(self, score) -> None:
-        if score < 0:
-            raise ValueError(f"Score value {score} is incorrect. Must be >= 0")
-        self.__score = score
+    def answers(self) -> tuple[Answer, ...]:
+        return self.__answers
 
     @property
-    def answers(self) -> list[Answer]:
-        return self.__answers
+    def correct_mask(self) -> int:
+        return self.__correct_mask
 
     def add_answer(self, text: str, correct: bool) -> None:
         """
@@ -82,7 +159,9 @@ class Question:
         Returns:
             None
         """
-        self.__answers.append(Answer(text, correct))
+        self.__answers += (Answer(text, correct),)
+        if correct:
+            self.__correct_mask |= 1 << (len(self.__answers) - 1)
 
     def delete_answer_by_index(self, answer_index) -> None:
         """
@@ -95,9 +174,10 @@ class Question:
         Returns:
             None
         """
-        if answer_index not in range(len(self.__answers)):
+        if not 0 <= answer_index < len(self.__answers):
             raise AnswerError(f"Cannot delete answer: index {answer_index} out of range")
-        del self.__answers[answer_index]
+        self.__answers = self.__answers[:answer_index] + self.__answers[answer_index + 1:]
+        self.__correct_mask = Question._compute_correct_mask(self.__answers)
 
     def update_answer(self, answer_index: int, text: str or None = None, correct: bool or None = None) -> None:
         """
@@ -112,12 +192,13 @@ class Question:
         Returns:
             None
         """
-        if answer_index not in range(len(self.__answers)):
+        if not 0 <= answer_index < len(self.__answers):
             raise AnswerError(f"Cannot update answer: index {answer_index} out of range")
         if text is not None:
             self.__answers[answer_index].text = text
         if correct is not None:
             self.__answers[answer_index].correct = correct
+            self.__correct_mask = Question._compute_correct_mask(self.__answers)
 
     def purge_answers(self) -> None:
         """
@@ -126,9 +207,10 @@ class Question:
         Returns:
             None
         """
-        self.__answers.clear()
+        self.__answers = ()
+        self.__correct_mask = 0
 
-    def set_answers(self, answers: list[Answer]) -> None:
+    def set_answers(self, answers: list[Answer] or tuple[Answer, ...]) -> None:
         """
         Sets or replace all answers with the given list
 
@@ -138,7 +220,8 @@ class Question:
         Returns:
             None
         """
-        self.__answers = answers
+        self.__answers = tuple(answers)
+        self.__correct_mask = Question._compute_correct_mask(self.__answers)
 
     def add_keywords(self, keywords: list[str]) -> None:
         """
@@ -151,8 +234,9 @@ class Question:
         Returns:
             None
         """
-        keywords = set(keyword.lower() for keyword in keywords)
-        self.__keywords = sorted(list(set(self.__keywords).union(keywords)))
+        merged = set(self.__keywords)
+        merged.update(sys.intern(keyword.lower()) for keyword in keywords)
+        self.__keywords = _pooled_keywords(tuple(sorted(merged)))
 
     def delete_keywords(self, keywords: list[str]) -> None:
         """
@@ -164,12 +248,12 @@ class Question:
         Returns:
             None
         """
-        keywords = set(keyword.lower() for keyword in keywords)
-        self.__keywords = sorted(list(set(self.__keywords) - set(keywords)))
+        remaining = set(self.__keywords).difference(keyword.lower() for keyword in keywords)
+        self.__keywords = _pooled_keywords(tuple(sorted(remaining)))
 
     def purge_keywords(self) -> None:
         """Removes all keywords"""
-        self.__keywords.clear()
+        self.__keywords = ()
 
     def set_keywords(self, keywords: list[str]) -> None:
         """
@@ -182,7 +266,7 @@ class Question:
         Returns:
             None
         """
-        self.__keywords = sorted([keyword.lower() for keyword in set(keywords)])
+        self.__keywords = _pooled_keywords(tuple(sorted({sys.intern(keyword.lower()) for keyword in keywords})))
 
     @staticmethod
     def from_dict(question_data: dict):
@@ -195,18 +279,23 @@ class Question:
         Returns:
             Question: a new Question object instance.
         """
-        answers = [Answer(**answer) for answer in question_data["answers"]]
-        question_data['answers'] = answers
-        return Question(**question_data)
+        answers = [Answer(answer["text"], answer.get("correct", False)) for answer in question_data["answers"]]
+        return Question(question_data["title"], question_data["text"], question_data["keywords"],
+                        question_data["score"], answers, question_data.get("unique_id"))
 
 
 class Quiz:
     """Represents a Quiz"""
+
+    __slots__ = ("__title", "author", "__description", "__questions_bank", "__questions_list", "__max_score")
+
     def __init__(self, title: str, author: str, description: str, questions: list[Question] or None = None) -> None:
         self.__title = title
         self.author = author
         self.__description = description
-        self.__questions_bank = {question.unique_id: question for question in questions} if questions is not None else {}
+        self.__questions_list = list(questions) if questions is not None else []
+        self.__questions_bank = None
+        self.__max_score = sum(question.score for question in self.__questions_list)
 
     @property
     def title(self) -> str:
@@ -226,18 +315,28 @@ class Quiz:
 
     @property
     def questions_count(self) -> int:
+        return len(self.__questions_list)
+
+    @property
+    def questions_by_id(self) -> dict[str, Question]:
+        """
+        The questions bank keyed on unique_id, built on first access since
+        most consumers only ever iterate the questions in order.
+
+        Returns:
+            dict[str, Question]: the questions bank
+        """
         if self.__questions_bank is None:
-            return 0
-        else:
-            return len(self.__questions_bank)
+            self.__questions_bank = {question.unique_id: question for question in self.__questions_list}
+        return self.__questions_bank
 
     @property
     def max_score(self) -> int:
-        return sum(question.score for question in self.__questions_bank.values()) if self.questions_count > 0 else 0
+        return self.__max_score
 
     def __repr__(self):
         return f"Quiz(title={repr(self.__title)}, description={repr(self.__description):.20}," \
-               f"questions={repr(self.__questions_bank)}"
+               f"questions={repr(self.__questions_list)}"
 
     def __str__(self):
         return f"{self.__title} ({self.__description})"
@@ -252,14 +351,15 @@ class Quiz:
         Returns:
             Quiz:   A Quiz Object instance.
         """
-        questions = [Question.from_dict(question_data) for question_data in quiz_data["questions"]]
-        quiz_data["questions"] = questions
         try:
-            quiz = Quiz(**quiz_data)
+            questions = [Question.from_dict(question_data) for question_data in quiz_data.pop("questions")]
+            quiz = Quiz(questions=questions, **quiz_data)
         except TypeError as error:
             raise QuizzError(error)
         except ValueError as error:
             raise QuizzError(error)
+        except KeyError as error:
+            raise QuizzError(f"Missing quiz data key: {error}")
         else:
             return quiz
 
@@ -287,7 +387,10 @@ class Quiz:
         except ValueError:
             raise QuestionError(f"Could not create question: Wrong arguments")
         else:
-            self.__questions_bank[question.unique_id] = question
+            self.__questions_list.append(question)
+            if self.__questions_bank is not None:
+                self.__questions_bank[question.unique_id] = question
+            self.__max_score += question.score
 
     def delete_question(self, unique_id: str) -> None:
         """
@@ -299,21 +402,28 @@ class Quiz:
         Returns:
             None
         """
-        if unique_id not in self.__questions_bank:
+        questions_bank = self.questions_by_id
+        if unique_id not in questions_bank:
             raise QuizzError(f"Question {unique_id} not in questions bank.")
-        del(self.__questions_bank[unique_id])
+        question = questions_bank[unique_id]
+        self.__questions_list.remove(question)
+        self.__max_score -= question.score
+        del(questions_bank[unique_id])
 
-    def get_questions(self, count: int) -> list[Question]:
+    def get_questions(self, count: int) -> tuple[list[Question], int]:
         """
-        Returns a list of questions.
+        Returns a list of questions and their total score.
 
         Args:
             count (int):                The number of questions to return (all questions if 1 > count > max)
 
         Returns:
-            list[Question]              The list of questions
+            tuple[list[Question], int]  The list of questions and the sum of their scores
         """
+        import random
+
         if count < 1 or count > self.questions_count:
             count = self.questions_count
 
-        return random.sample(list(self.__questions_bank.values()), count)
+        questions = random.sample(self.__questions_list, count)
+        return questions, sum(map(operator.attrgetter("score"), questions))
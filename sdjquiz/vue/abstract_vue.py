@@ -1,9 +1,9 @@
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 
-class QuizVue(ABC):
+@runtime_checkable
+class QuizVue(Protocol):
 
-    @abstractmethod
     def ask_file_path(self) -> str:
         """
         Ask user for a path to the quiz data file and returns it.
@@ -11,9 +11,8 @@ class QuizVue(ABC):
         Returns:
             str:    the path to the file (can be absolute or relative)
         """
-        pass
+        ...
 
-    @abstractmethod
     def clear(self) -> None:
         """
         Clears the screen
@@ -21,9 +20,8 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
 
-    @abstractmethod
     def pause(self) -> None:
         """
         Mark a pause (ie: ask user to press a key or anything like that).
@@ -31,9 +29,8 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
 
-    @abstractmethod
     def show_error(self, message: str or Exception) -> None:
         """
         Display error message to the user
@@ -43,9 +40,8 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
 
-    @abstractmethod
     def show_greetings(self, quiz_title: str, quiz_description: str, quiz_questions_count: int, quiz_max_score: int) -> None:
         """
         Welcomes the user and shows basic information about the quiz
@@ -58,9 +54,8 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
 
-    @abstractmethod
     def ask_questions_count(self, default_count: int) -> int:
         """
         Asks the user how many questions he wants to answer.
@@ -71,9 +66,8 @@ class QuizVue(ABC):
         Returns:
             int:    the number of questions
         """
-        pass
+        ...
 
-    @abstractmethod
     def show_question(self, question_index: int, title: str, text: str, answers: list[str], correct_count: int) -> None:
         """
         Displays the question to the user
@@ -88,9 +82,8 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
 
-    @abstractmethod
     def ask_answer(self) -> str:
         """
         Asks and returns the user answer
@@ -103,9 +96,8 @@ class QuizVue(ABC):
         Returns:
             str: the user answer
         """
-        pass
+        ...
 
-    @abstractmethod
     def show_result(self, quiz_title: str, score: int, max_score: int) -> None:
         """
         Displays the result of the quiz
@@ -118,4 +110,4 @@ class QuizVue(ABC):
         Returns:
             None
         """
-        pass
+        ...
@@ -1,9 +1,8 @@
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt
-from sdjquiz.vue.abstract_vue import QuizVue
 
 
-class QuizTUI(QuizVue):
+class QuizTUI:
     def __init__(self):
         self.console = Console()
 
@@ -93,15 +92,10 @@ class QuizTUI(QuizVue):
             None
         """
         self.clear()
-        self.console.print(f"----[ Q{question_index+1:3d} : {title} ]----")
-        self.console.print(text)
-        self.console.line()
-        self.console.print(f"Answers (select {correct_count}):")
-
-        for idx, answer in enumerate(answers):
-            self.console.print(f"{idx+1}) {answer}")
-
-        self.console.line()
+        lines = [f"----[ Q{question_index+1:3d} : {title} ]----", text, "", f"Answers (select {correct_count}):"]
+        lines.extend(f"{idx+1}) {answer}" for idx, answer in enumerate(answers))
+        lines.append("")
+        self.console.print("\n".join(lines))
 
     def ask_answer(self) -> str:
         """